@@ -1,12 +1,35 @@
 """Config of metadata for functions used in ssb-nudb-use."""
 
 from importlib.metadata import version
+from typing import TYPE_CHECKING
+from typing import Any
 
-from .config import settings
+if TYPE_CHECKING:
+    from .config import settings
 
 __all__ = ["settings"]
 
 
+def __getattr__(name: str) -> Any:
+    """Import ``settings`` lazily, so importing the package reads no TOML files.
+
+    Args:
+        name: Attribute name requested from the package.
+
+    Returns:
+        Any: The loaded settings when ``name`` is ``"settings"``.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily provided attribute.
+    """
+    if name == "settings":
+        from .config import settings
+
+        globals()["settings"] = settings
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class MissingVersionWarning(UserWarning): ...
 
 
@@ -1,3 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
 from nudb_config.pydantic.load import load_pydantic_settings
 
-settings = load_pydantic_settings()
+if TYPE_CHECKING:
+    from nudb_config.pydantic.load import NudbConfig
+
+    settings: NudbConfig
+
+
+def _build_settings() -> NudbConfig:
+    """Load the package-embedded TOML files into the unified config."""
+    return load_pydantic_settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``settings`` on first access instead of at import (PEP 562).
+
+    The built config is stored in the module namespace, so later lookups are
+    plain attribute access and never reach this function again.
+
+    Args:
+        name: Attribute name requested from the module.
+
+    Returns:
+        Any: The loaded ``NudbConfig`` when ``name`` is ``"settings"``.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily provided attribute.
+    """
+    if name == "settings":
+        value = _build_settings()
+        globals()["settings"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
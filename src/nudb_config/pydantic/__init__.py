@@ -1,9 +1,36 @@
 """Load nudbs config into Pydantic models for correct type annotations."""
 
-from .load import NudbConfig
-from .load import load_pydantic_settings
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .load import NudbConfig
+    from .load import load_pydantic_settings
 
 __all__ = [
     "NudbConfig",
     "load_pydantic_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the loader lazily, so importing this package skips ``pydantic``.
+
+    Args:
+        name: Attribute name requested from the package.
+
+    Returns:
+        Any: ``NudbConfig`` or ``load_pydantic_settings`` from ``.load``.
+
+    Raises:
+        AttributeError: If ``name`` is not a lazily provided attribute.
+    """
+    if name in __all__:
+        from .load import NudbConfig
+        from .load import load_pydantic_settings
+
+        globals().update(
+            NudbConfig=NudbConfig, load_pydantic_settings=load_pydantic_settings
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
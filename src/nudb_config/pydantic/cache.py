@@ -0,0 +1,171 @@
+"""Pickled snapshot of the assembled package config, reused across loads and processes."""
+
+from __future__ import annotations
+
+import functools
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Hashable
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from .. import __version__
+from ..logger import logger
+
+# Set to "0" to neither read nor write the on-disk snapshot
+CACHE_ENV_VAR = "NUDB_CONFIG_CACHE"
+
+# Installed nudb_config package, whose location tells environments apart
+_PACKAGE_DIR = Path(__file__).resolve().parents[1]
+
+# Pickled configs by snapshot key, reused by later loads in this process
+_memory: dict[tuple[Hashable, ...], bytes] = {}
+
+
+def cache_path() -> Path:
+    """Return the snapshot location under the user's cache directory.
+
+    Each install gets its own file, so several virtualenvs or kernels of the
+    same user keep a valid snapshot side by side.
+
+    Returns:
+        Path: ``$XDG_CACHE_HOME/ssb-nudb-config/settings-<hash>.pkl``,
+        defaulting to ``~/.cache`` when ``XDG_CACHE_HOME`` is unset.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ssb-nudb-config" / _file_name(_PACKAGE_DIR)
+
+
+@functools.cache
+def _file_name(package_dir: Path) -> str:
+    """Return the snapshot file name for the package installed at ``package_dir``."""
+    install = f"{package_dir}|{__version__}|{sys.version_info[:2]}"
+    digest = hashlib.sha256(install.encode("utf-8")).hexdigest()[:16]
+    return f"settings-{digest}.pkl"
+
+
+def cache_enabled() -> bool:
+    """Return False when the on-disk snapshot is switched off via ``NUDB_CONFIG_CACHE``."""
+    return os.environ.get(CACHE_ENV_VAR, "1") != "0"
+
+
+def snapshot_key(paths: Sequence[Path]) -> tuple[Hashable, ...]:
+    """Build the key that invalidates the snapshot when any input changes.
+
+    Args:
+        paths: Files the config is built from, including the model sources.
+
+    Returns:
+        tuple[Hashable, ...]: Package, Python and Pydantic versions, and the
+        name, mtime and size of every file in ``paths``.
+    """
+    stats = []
+    for path in paths:
+        stat = path.stat()
+        stats.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return (
+        __version__,
+        sys.version_info[:2],
+        pydantic.VERSION,
+        tuple(stats),
+    )
+
+
+def clear_memory() -> None:
+    """Forget the snapshots kept in this process, e.g. between tests."""
+    _memory.clear()
+
+
+def read_snapshot(key: tuple[Hashable, ...]) -> Any | None:
+    """Return a fresh copy of the cached config if it was stored for ``key``.
+
+    Looks in this process first, then in the on-disk snapshot unless that is
+    switched off. Every call unpickles a new object, so callers may mutate it.
+
+    Args:
+        key: Key from ``snapshot_key`` for the current inputs.
+
+    Returns:
+        Any | None: The unpickled config, or None when there is no usable
+        snapshot.
+    """
+    data = _memory.get(key)
+    if data is None and cache_enabled():
+        data = _read_file(key)
+        if data is not None:
+            _memory[key] = data
+    if data is None:
+        return None
+    # Unpickling allocates many container objects at once; pausing the cyclic
+    # GC keeps it from repeatedly scanning the half-built config
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    except Exception as err:
+        logger.debug("Ignoring unreadable config snapshot: %s", err)
+        _memory.pop(key, None)
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def write_snapshot(key: tuple[Hashable, ...], config: Any) -> None:
+    """Store ``config`` under ``key`` in this process and, if enabled, on disk.
+
+    Failures are logged and otherwise ignored, since the snapshot only speeds
+    up later loads.
+
+    Args:
+        key: Key from ``snapshot_key`` for the inputs ``config`` was built from.
+        config: The assembled config to pickle.
+    """
+    try:
+        data = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as err:
+        logger.debug("Could not pickle config snapshot: %s", err)
+        return
+    _memory[key] = data
+    if cache_enabled():
+        _write_file(key, data)
+
+
+def _read_file(key: tuple[Hashable, ...]) -> bytes | None:
+    """Return the pickled config from disk if the file was written for ``key``."""
+    try:
+        with cache_path().open("rb") as fh:
+            if pickle.load(fh) != key:
+                return None
+            return fh.read()
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        logger.debug("Ignoring unreadable config snapshot: %s", err)
+        return None
+
+
+def _write_file(key: tuple[Hashable, ...], data: bytes) -> None:
+    """Write ``key`` and the pickled config, replacing the file atomically."""
+    path = cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                # Key first, so a stale snapshot is rejected without loading it all
+                pickle.dump(key, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                fh.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except Exception as err:
+        logger.debug("Could not write config snapshot: %s", err)
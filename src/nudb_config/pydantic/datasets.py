@@ -29,16 +29,20 @@ class Dataset(DotMapBaseModel):
 
 
 class DatasetOverride(DotMapBaseModel):
-    """Partial dataset override entry under ``[datasets]``."""
+    """Partial dataset override entry under ``[datasets]``.
+
+    Only used while loading, and dumped back to plain data before merging,
+    so the nested maps are plain dicts rather than ``DotMapDict``.
+    """
 
     team: str | None = None
     bucket: str | None = None
     path_glob: str | None = None
     variables: list[str] | None = None
-    thresholds_empty: DotMapDict[float] | None = None
-    min_values: DotMapDict[str] | None = None
-    max_values: DotMapDict[str] | None = None
-    dataset_specific_renames: DotMapDict[str] | None = None
+    thresholds_empty: dict[str, float] | None = None
+    min_values: dict[str, str] | None = None
+    max_values: dict[str, str] | None = None
+    dataset_specific_renames: dict[str, str] | None = None
 
 
 class DatasetsFile(DotMapBaseModel):
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import ItemsView
 from collections.abc import Iterator
 from collections.abc import KeysView
 from collections.abc import Mapping
 from collections.abc import ValuesView
+from itertools import islice
 from typing import Any
+from typing import ClassVar
 from typing import Generic
 from typing import TypeVar
 from typing import cast
@@ -22,57 +25,94 @@ except Exception:
 
 UNRECOGNIZED = "Unrecognized key datatype"
 
+# Default for getattr lookups, so misses need no try/except
+_MISSING = object()
 
-class DotMap:
-    """Provide dot- and item-access for wrappers and Pydantic models.
 
-    Usage:
-    - Wrapper: ``DotMap({"a": 1}).a`` and ``DotMap({"a": 1})["a"]``.
-    - Base class: ``class M(DotMap, BaseModel): ...`` so ``m.a`` and
-      ``m["a"]`` both work, without conflicting with Pydantic's iterator.
-    - When mixed into Pydantic models, initialization defers to Pydantic;
-      otherwise a mapping positional argument or ``data=`` keyword seeds the
-      internal store.
+def _key_at(keys: KeysView[str], index: int) -> str:
+    """Return the key at position ``index`` without copying the keys to a list.
+
+    Args:
+      keys: Keys view to pick from.
+      index: Position of the key; negative values count from the end.
+
+    Returns:
+      str: The key at ``index``.
+
+    Raises:
+      IndexError: If ``index`` is out of range.
     """
+    position = index + len(keys) if index < 0 else index
+    if position >= 0:
+        for key in islice(keys, position, None):
+            return key
+    raise IndexError(index)
 
-    # Avoid __slots__ to stay layout-compatible with Pydantic BaseModel
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        if isinstance(self, _PydanticBaseModel):
-            super().__init__(*args, **kwargs)
-            return
+def _subclass_key(keys: KeysView[str], key: str | int) -> str:
+    """Resolve a key of a ``str`` or ``int`` subclass, such as an enum member.
 
-        data = args[0] if args else kwargs.get("data", {})
-        self._data = data if isinstance(data, dict) else {}
+    Exact ``str`` and ``int`` keys are handled inline by the callers.
+
+    Args:
+      keys: Keys view to pick from for integer positions.
+      key: The key to resolve.
+
+    Returns:
+      str: The key itself, or the key at position ``key``.
+    """
+    if isinstance(key, int):
+        return _key_at(keys, key)
+    return key
+
+
+class DotMapMixin:
+    """Provide dict-style access for Pydantic models.
+
+    Usage: ``class M(DotMapMixin, BaseModel): ...`` so ``m.a`` and ``m["a"]``
+    both work, without conflicting with Pydantic's iterator. Initialization
+    is left entirely to Pydantic. For plain dicts, use ``DotMapWrapper``
+    (exported as ``DotMap``), which cannot be combined with ``BaseModel``.
+    """
+
+    # Empty __slots__ stays layout-compatible with Pydantic BaseModel
+    __slots__ = ()
+
+    # Whether the class is a Pydantic model, whose field values live in __dict__
+    _is_pydantic: ClassVar[bool] = False
+
+    # Field names of DotMapBaseModel subclasses, filled in at class creation
+    _field_names: ClassVar[frozenset[str] | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record once per class whether instances are Pydantic models."""
+        super().__init_subclass__(**kwargs)
+        cls._is_pydantic = _PydanticBaseModel is not object and issubclass(
+            cls, _PydanticBaseModel
+        )
 
     def __getattr__(self, name: str) -> Any:
-        """Return attribute from the internal mapping in wrapper mode.
+        """Raise AttributeError for a missing attribute.
 
-        For Pydantic BaseModel subclasses, this is only invoked for missing
-        attributes and therefore does not interfere with normal field access.
+        This is only invoked for attributes that normal lookup did not find,
+        and therefore does not interfere with Pydantic field access.
 
         Args:
           name: Attribute name to resolve.
 
         Returns:
-          Any: The value associated with ``name`` from the internal mapping.
+          Any: Nothing; the method always raises.
 
         Raises:
-          AttributeError: If ``name`` is not present in the mapping.
+          AttributeError: Always, since ``name`` was not found.
         """
-        try:
-            mapping = object.__getattribute__(self, "_data")
-        except AttributeError:
-            mapping = None
-        if isinstance(mapping, dict) and name in mapping:
-            return mapping[name]
         raise AttributeError(name)
 
     def __getitem__(self, key: str | int) -> Any:
         """Return a value via dict-style indexing.
 
-        Prefers attribute access (e.g., Pydantic field) and falls back to the
-        internal mapping if the attribute is not found.
+        Reads Pydantic fields from the instance ``__dict__``, and only falls
+        back to attribute access for other attributes.
 
         Args:
           key: The key to look up.
@@ -84,27 +124,29 @@ class DotMap:
           KeyError: If ``key`` is not found.
           TypeError: If ``key`` is not a string or integer index.
         """
-        if isinstance(key, int):
-            key_str: str = list(self.keys())[key]
-        elif isinstance(key, str):
-            key_str = key
+        key_type = type(key)
+        if key_type is str:
+            key_str = cast(str, key)
+        elif key_type is int:
+            key_str = _key_at(self.keys(), cast(int, key))
+        elif isinstance(key, str | int):
+            key_str = _subclass_key(self.keys(), key)
         else:
             raise TypeError(UNRECOGNIZED)
 
-        try:
-            return getattr(self, key_str)
-        except AttributeError:
-            mapping = self._as_mapping()
-            try:
-                return mapping[key_str]
-            except KeyError as exc:
-                raise KeyError(key_str) from exc
+        mapping = self._as_mapping()
+        if key_str in mapping:
+            return mapping[key_str]
+        value = getattr(self, key_str, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key_str)
+        return value
 
     def __setitem__(self, key: str | int, value: Any) -> None:
         """Assign a value via dict-style indexing.
 
-        For Pydantic models, this sets the field/attribute so validation can
-        run. For wrapper usage, this stores into the internal mapping.
+        This sets the field/attribute, so validation can run where the model
+        is configured for it.
 
         Args:
           key: The key to assign.
@@ -113,24 +155,20 @@ class DotMap:
         Raises:
           TypeError: If ``key`` is not a string or integer index.
         """
-        if isinstance(key, int):
-            key_str: str = list(self.keys())[key]
-        elif isinstance(key, str):
-            key_str = key
+        key_type = type(key)
+        if key_type is str:
+            key_str = cast(str, key)
+        elif key_type is int:
+            key_str = _key_at(self.keys(), cast(int, key))
+        elif isinstance(key, str | int):
+            key_str = _subclass_key(self.keys(), key)
         else:
             raise TypeError(UNRECOGNIZED)
 
-        try:
-            setattr(self, key_str, value)
-        except AttributeError:
-            mapping = getattr(self, "_data", None)
-            if not isinstance(mapping, dict):
-                mapping = {}
-                object.__setattr__(self, "_data", mapping)
-            mapping[key_str] = value
+        setattr(self, key_str, value)
 
     def __contains__(self, key: object) -> bool:
-        """Return True if ``key`` exists as a field or mapping entry.
+        """Return True if ``key`` is a field of the model.
 
         Args:
           key: Candidate key to check. Non-string keys return ``False``.
@@ -140,22 +178,22 @@ class DotMap:
         """
         if not isinstance(key, str):
             return False
+        field_names = type(self)._field_names
+        if field_names is not None:
+            return key in field_names
         fields = getattr(type(self), "model_fields", None)
-        if isinstance(fields, dict):
-            return key in fields
-        mapping = getattr(self, "_data", None)
-        return isinstance(mapping, dict) and key in mapping
+        return isinstance(fields, dict) and key in fields
 
     def keys(self) -> KeysView[str]:
-        """Return a dynamic view of keys across model or mapping."""
+        """Return a dynamic view of the field names."""
         return self._as_mapping().keys()
 
     def items(self) -> ItemsView[str, Any]:
-        """Return a dynamic view of key/value pairs across model or mapping."""
+        """Return a dynamic view of field name/value pairs."""
         return self._as_mapping().items()
 
     def values(self) -> ValuesView[Any]:
-        """Return a dynamic view of values across model or mapping."""
+        """Return a dynamic view of the field values."""
         return self._as_mapping().values()
 
     @overload
@@ -167,7 +205,7 @@ class DotMap:
     def get(self, key: str, default: Any | None = None) -> Any:
         """Return the value for ``key`` if present; otherwise ``default``.
 
-        Tries attribute access first and then falls back to the mapping view.
+        Looks in the field ``__dict__``, without raising internally.
 
         Args:
           key: The key to look up.
@@ -176,40 +214,90 @@ class DotMap:
         Returns:
           Any: The found value or ``default`` if absent.
         """
-        try:
-            return getattr(self, key)
-        except AttributeError:
-            return self._as_mapping().get(key, default)
+        return self._as_mapping().get(key, default)
 
     def _as_mapping(self) -> dict[str, Any]:
         """Return a mapping view of the instance data.
 
-        Uses ``model_dump`` for Pydantic models; otherwise returns the
-        internal ``_data`` mapping or an empty dict.
+        Pydantic models keep their field values in ``__dict__``, which is
+        returned as a shallow view; call ``model_dump`` explicitly for a deep
+        copy. Classes that are not Pydantic models have no fields and return
+        an empty dict.
 
         Returns:
           dict[str, Any]: A dictionary representation of the current data.
         """
-        model_dump = getattr(self, "model_dump", None)
-        if callable(model_dump):
-            dumped_model: dict[str, Any] = model_dump()
-            return dumped_model
-        mapping = getattr(self, "_data", None)
-        return mapping if isinstance(mapping, dict) else {}
+        if type(self)._is_pydantic:
+            field_values: dict[str, Any] = self.__dict__
+            return field_values
+        return {}
+
+
+class DotMapWrapper(dict[str, Any]):
+    """Plain dict with dot-access.
+
+    ``DotMapWrapper({"a": 1}).a`` and ``DotMapWrapper({"a": 1})["a"]`` both
+    work. Item access, ``get``, ``keys`` and friends are the built-in dict
+    methods; attribute access maps onto the same entries. Integer keys that
+    are not stored pick the entry at that position, as for ``DotMapDict``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        data = args[0] if args else kwargs.get("data", {})
+        super().__init__(data if isinstance(data, dict) else {})
+
+    def __missing__(self, key: object) -> Any:
+        """Resolve integer positions; only called for keys that are not stored."""
+        if type(key) is int:
+            return self[_key_at(self.keys(), key)]
+        raise KeyError(key)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the entry ``name``, raising AttributeError if it is missing."""
+        try:
+            return self[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store ``value`` as the entry ``name``."""
+        self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        """Delete the entry ``name``, raising AttributeError if it is missing."""
+        try:
+            del self[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
 
     def __repr__(self) -> str:
         """Return a developer-friendly representation of the DotMap."""
-        return f"DotMap({self._as_mapping()!r})"
+        return f"DotMap({dict.__repr__(self)})"
 
 
-class DotMapBaseModel(_PydanticBaseModel, DotMap):
+# Kept for backwards compatibility: ``DotMap({...})`` builds a wrapper
+DotMap = DotMapWrapper
+
+
+class DotMapBaseModel(_PydanticBaseModel, DotMapMixin):
     """Combines the Dotmap class with Basemodel, placing BaseModel first."""
 
-    pass
+    _field_names: ClassVar[frozenset[str] | None] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the field names once Pydantic has collected ``model_fields``."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_names = frozenset(cls.model_fields)
 
 
 T = TypeVar("T")
 
+# DotMapDict core schemas for builtin value types, keyed by (class, value type)
+_SCHEMA_CACHE: dict[tuple[type[Any], Any], core_schema.CoreSchema] = {}
+
 
 class DotMapDict(Generic[T]):
     """Dictionary wrapper that supports both attribute and item access."""
@@ -217,7 +305,12 @@ class DotMapDict(Generic[T]):
     def __init__(
         self, data: Mapping[str, T] | None = None, *, value_type: type[T] | None = None
     ) -> None:
-        self._data: dict[str, T] = dict(data or {})
+        # Interned keys let repeated lookups short-circuit on identity; only
+        # exact strings can be interned
+        self._data: dict[str, T] = {
+            sys.intern(key) if type(key) is str else key: value
+            for key, value in (data or {}).items()
+        }
         if value_type is Any:
             value_type = None
         self._value_type: type[T] | None = value_type
@@ -226,45 +319,75 @@ class DotMapDict(Generic[T]):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        """Build a Pydantic core schema for typed dict-like validation."""
+        """Build a Pydantic core schema for typed dict-like validation.
+
+        Schemas for builtin value types (``str``, ``float``, ...) are cached per
+        class and value type, since the same parametrization is used by many
+        fields. Any other value type, including unions and containers, is
+        rebuilt each time, because its schema may reference model definitions
+        local to the model being built.
+        """
         args = get_args(source_type)
         value_type = args[0] if args else Any
+        cacheable = value_type is Any or (
+            type(value_type) is type and value_type.__module__ == "builtins"
+        )
+        cache_key = (cls, value_type)
+        if cacheable:
+            cached = _SCHEMA_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
         dict_schema = core_schema.dict_schema(
             keys_schema=core_schema.str_schema(),
             values_schema=handler.generate_schema(value_type),
         )
 
-        union_schema = core_schema.union_schema(
-            [core_schema.is_instance_schema(cls), dict_schema]
-        )
+        init_type = value_type if isinstance(value_type, type) else None
 
-        def build(value: Mapping[str, Any] | DotMapDict[Any]) -> DotMapDict[Any]:
+        def build(
+            value: Any, validate: core_schema.ValidatorFunctionWrapHandler
+        ) -> DotMapDict[Any]:
+            # Existing wrappers pass straight through; only mappings are validated
             if isinstance(value, cls):
                 return value
-            data = cast(Mapping[str, Any], value)
-            init_type = value_type if isinstance(value_type, type) else None
+            data = cast(Mapping[str, Any], validate(value))
             return cls(data, value_type=cast(type[Any] | None, init_type))
 
-        return core_schema.no_info_after_validator_function(build, union_schema)
+        # Serialize wrappers as-is, as the former instance branch of the schema did
+        schema = core_schema.no_info_wrap_validator_function(
+            build, dict_schema, serialization=core_schema.simple_ser_schema("any")
+        )
+        if cacheable:
+            _SCHEMA_CACHE[cache_key] = schema
+        return schema
 
     def __getitem__(self, key: str | int) -> T:
         """Return a value via dict-style indexing."""
-        if isinstance(key, int):
-            key = list(self._data.keys())[key]
-        if not isinstance(key, str):
+        key_type = type(key)
+        if key_type is str:
+            key_str = cast(str, key)
+        elif key_type is int:
+            key_str = _key_at(self._data.keys(), cast(int, key))
+        elif isinstance(key, str | int):
+            key_str = _subclass_key(self._data.keys(), key)
+        else:
             raise TypeError(UNRECOGNIZED)
-        try:
-            return self._data[key]
-        except KeyError as exc:
-            raise KeyError(key) from exc
+        return self._data[key_str]
 
-    def __setitem__(self, key: str | int, value: T) -> None:
+    def __setitem__(self, key: str | int, value: T | Mapping[str, Any]) -> None:
         """Assign a value via dict-style indexing, coercing to the target type."""
-        if isinstance(key, int):
-            key = list(self._data.keys())[key]
-        if not isinstance(key, str):
+        key_type = type(key)
+        if key_type is str:
+            key_str = cast(str, key)
+        elif key_type is int:
+            key_str = _key_at(self._data.keys(), cast(int, key))
+        elif isinstance(key, str | int):
+            key_str = _subclass_key(self._data.keys(), key)
+        else:
             raise TypeError(UNRECOGNIZED)
-        self._data[key] = self._coerce_value(value)
+        key_str = sys.intern(key_str) if type(key_str) is str else key_str
+        self._data[key_str] = self._coerce_value(value)
 
     def __delitem__(self, key: str) -> None:
         """Delete the item associated with ``key``."""
@@ -293,6 +416,7 @@ class DotMapDict(Generic[T]):
         if name.startswith("_") or name in type(self).__dict__:
             object.__setattr__(self, name, value)
             return
+        name = sys.intern(name) if type(name) is str else name
         self._data[name] = self._coerce_value(value)
 
     def __contains__(self, key: object) -> bool:
@@ -321,17 +445,17 @@ class DotMapDict(Generic[T]):
         """Return the value for ``key`` if present; otherwise ``default``."""
         return self._data.get(key, default)
 
-    def _coerce_value(self, value: T) -> T:
+    def _coerce_value(self, value: T | Mapping[str, Any]) -> T:
         """Convert or validate values against the configured target type."""
         value_type = self._value_type
         if value_type is None:
-            return value
+            return cast(T, value)
         if isinstance(value, value_type):
             return value
         model_validate = getattr(value_type, "model_validate", None)
         if callable(model_validate):
             return cast(T, model_validate(value))
-        return value
+        return cast(T, value)
 
     def __repr__(self) -> str:
         """Return a developer-friendly representation of the DotMapDict."""
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import copy
+import functools
 import importlib.resources as impres
+import logging
+import os
+import sys
 import tomllib
+from collections.abc import Collection
+from collections.abc import Iterator
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
+from typing import TypeVar
 from typing import cast
 from typing import get_args
 
 from pydantic import ConfigDict
+from pydantic import TypeAdapter
 
 from ..logger import logger
+from . import cache
 from .constants import Constants
 from .constants import ConstantsFile
 from .datasets import Dataset
@@ -30,6 +41,34 @@ MERGE_WARNING = (
     "Merge overwrite has same value; consider removing from local config: %s"
 )
 
+_ModelT = TypeVar("_ModelT", bound=DotMapBaseModel)
+
+# Variable fields with few distinct values across all the variables
+_INTERNED_FIELDS = ("unit", "dtype", "klass_codelist_from_date")
+
+_NONE_STRINGS = frozenset({"none", "None", "NONE"})
+
+# Codes 360 uses on top of KLASS codelists we do not control, keyed by codelist id.
+# Read-only, since every variable gets a copy and the table itself must not change.
+_CODELIST_EXTRAS: Mapping[int, Mapping[str, str]] = MappingProxyType(
+    {
+        91: MappingProxyType(
+            {
+                "151": "DDR / Øst-Tyskland",
+                "135": "SSSR / Sovjetunionen",
+                "125": "Jugoslavia (til 2004) / Serbia og Montenegro (fra og med 2004)",
+                "142": "Tsjekkoslovakia",
+            }
+        ),
+        131: MappingProxyType(
+            {
+                "2599": "Utland",
+                "2111": "Longyearbyen arealplanområde",
+            }
+        ),
+    }
+)
+
 
 class NudbConfig(DotMapBaseModel):
     """Unified configuration built from the TOML files.
@@ -69,25 +108,36 @@ class NudbConfig(DotMapBaseModel):
     def merge_tomls(self, toml_dir: str | Path) -> NudbConfig:
         """Merge values from external TOML files into this config and return it."""
         cfg_dir = _resolve_toml_dir(toml_dir)
-        for path in sorted(cfg_dir.glob("*.toml")):
-            toml_data = _load_toml(path)
+        for name in _scan_toml_names(cfg_dir):
+            toml_data = _load_toml(cfg_dir / name)
             _merge_into(self, toml_data)
         return self
 
     def _deep_copy(self) -> NudbConfig:
-        try:
-            return self.model_copy(deep=True)
-        except Exception:
-            return copy.deepcopy(self)
+        return self.model_copy(deep=True)
+
+
+def _load_toml(path: Path) -> dict[str, object]:
+    """Return the parsed contents of ``path``, reusing earlier parses of the file.
 
+    The cache is keyed on the file's mtime and size, so edited files are read
+    again. A deep copy is returned, since merging stores parts of the result
+    in the config.
+    """
+    stat = path.stat()
+    parsed = _parse_toml_file(str(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(parsed)
 
-# Ensure forward refs are resolved for Pydantic
-NudbConfig.model_rebuild()
 
+@functools.lru_cache(maxsize=64)
+def _parse_toml_file(path: str, mtime_ns: int, size: int) -> dict[str, object]:
+    """Parse the TOML file at ``path``; ``mtime_ns`` and ``size`` only key the cache."""
+    return tomllib.loads(Path(path).read_bytes().decode("utf-8"))
 
-def _load_toml(path: Path) -> dict[str, object]:
-    with path.open("rb") as fh:
-        return tomllib.load(fh)
+
+def _load_tomls(paths: list[Path]) -> dict[Path, dict[str, object]]:
+    """Read and parse ``paths`` one after another, keyed by path."""
+    return {path: tomllib.loads(path.read_bytes().decode("utf-8")) for path in paths}
 
 
 def _resolve_toml_dir(toml_dir: str | Path) -> Path:
@@ -103,8 +153,13 @@ def _resolve_toml_dir(toml_dir: str | Path) -> Path:
 def _is_none_sentinel(value: object) -> bool:
     if value is None:
         return True
-    if isinstance(value, str) and value.strip().lower() == "none":
-        return True
+    if isinstance(value, str):
+        if value in _NONE_STRINGS:
+            return True
+        # Only strings that could still spell "none" pay for strip/lower copies
+        if len(value) < 4 or ("n" not in value and "N" not in value):
+            return False
+        return value.strip().lower() == "none"
     return False
 
 
@@ -113,81 +168,94 @@ def _merge_into(target: object, updates: object) -> None:
         _merge_mapping(target, updates, path=())
 
 
-def _merge_mapping(
-    target: object, updates: dict[str, object], *, path: tuple[str, ...]
-) -> None:
+# Kinds of merge targets, resolved once per node instead of once per key
+_DOTMAPDICT = 0
+_VARIABLES = 1  # DotMapDict of Variable, whose new entries get their key as name
+_MODEL = 2
+_DICT = 3
+
+# (kind, target, remaining update items, path, model fields) of one merge level
+_MergeFrame = tuple[
+    int, Any, Iterator[tuple[str, object]], tuple[str, ...], dict[str, Any]
+]
+
+
+def _merge_frame(
+    target: object, updates: dict[str, object], path: tuple[str, ...]
+) -> _MergeFrame | None:
     if isinstance(target, DotMapDict):
-        _merge_dotmapdict(target, updates, path)
-        return
+        kind = _VARIABLES if target._value_type is Variable else _DOTMAPDICT
+        return (kind, target, iter(updates.items()), path, {})
     if isinstance(target, DotMapBaseModel):
-        _merge_dotmap_model(target, updates, path)
-        return
+        fields = type(target).model_fields
+        return (_MODEL, target, iter(updates.items()), path, fields)
     if isinstance(target, dict):
-        _merge_plain_dict(target, updates, path)
+        return (_DICT, target, iter(updates.items()), path, {})
+    return None
 
 
-def _merge_dotmapdict(
-    target: DotMapDict[Any], updates: dict[str, object], path: tuple[str, ...]
+def _merge_mapping(
+    target: object, updates: dict[str, object], *, path: tuple[str, ...]
 ) -> None:
-    for key, value in updates.items():
-        if _is_none_sentinel(value):
-            if key in target:
-                del target[key]
-            continue
-        value = _maybe_inject_variable_name(target, key, value)
-        if key in target:
-            current = target[key]
-            if _should_descend(value, current):
-                value_dict = cast(dict[str, object], value)
-                _merge_mapping(current, value_dict, path=(*path, key))
-                continue
-            _warn_if_same(current, value, path, key)
-            target[key] = value
-        else:
-            target[key] = value
-
+    """Merge ``updates`` into ``target`` depth-first, without recursion.
 
-def _merge_dotmap_model(
-    target: DotMapBaseModel, updates: dict[str, object], path: tuple[str, ...]
-) -> None:
-    model_fields = getattr(type(target), "model_fields", {})
-    for key, value in updates.items():
-        if key not in model_fields:
+    Each level of nesting is a frame on an explicit stack, so updates are
+    applied in the same order a recursive merge would apply them.
+    """
+    frame = _merge_frame(target, updates, path)
+    stack = [frame] if frame is not None else []
+    while stack:
+        kind, node, items, node_path, fields = stack[-1]
+        entry = next(items, None)
+        if entry is None:
+            stack.pop()
             continue
-        if _is_none_sentinel(value):
-            field = model_fields[key]
-            if _field_allows_none(field):
-                setattr(target, key, None)
+        key, value = entry
+        if kind == _MODEL and key not in fields:
             continue
-        current = getattr(target, key, None)
-        if _should_descend(value, current):
-            value_dict = cast(dict[str, object], value)
-            _merge_mapping(current, value_dict, path=(*path, key))
+        if _is_none_sentinel(value):
+            _remove_entry(kind, node, fields, key)
             continue
-        _warn_if_same(current, value, path, key)
-        setattr(target, key, value)
 
+        if kind == _VARIABLES and isinstance(value, dict) and "name" not in value:
+            value = {**value, "name": key}
+        if kind == _MODEL:
+            current = getattr(node, key, None)
+        else:
+            current = node.get(key)
 
-def _merge_plain_dict(
-    target: dict[str, object], updates: dict[str, object], path: tuple[str, ...]
-) -> None:
-    for key, value in updates.items():
-        if _is_none_sentinel(value):
-            target.pop(key, None)
-            continue
-        current = target.get(key)
         if _should_descend(value, current):
             value_dict = cast(dict[str, object], value)
-            _merge_mapping(current, value_dict, path=(*path, key))
+            child = _merge_frame(current, value_dict, (*node_path, key))
+            if child is not None:
+                stack.append(child)
             continue
-        _warn_if_same(current, value, path, key)
-        target[key] = value
+        _warn_if_same(current, value, node_path, key)
+        if kind == _MODEL:
+            setattr(node, key, value)
+        else:
+            node[key] = value
+
+
+def _remove_entry(kind: int, node: Any, fields: dict[str, Any], key: str) -> None:
+    """Apply a ``None`` sentinel for ``key`` to a merge target of ``kind``."""
+    if kind == _DOTMAPDICT or kind == _VARIABLES:
+        if key in node:
+            del node[key]
+    elif kind == _MODEL:
+        if _field_allows_none(fields[key]):
+            setattr(node, key, None)
+    else:
+        node.pop(key, None)
 
 
 def _warn_if_same(
     current: object, value: object, path: tuple[str, ...], key: str
 ) -> None:
-    if current == value:
+    # The warning is informational, so skip the comparison when it is silenced
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    if current is value or current == value:
         logger.warning(MERGE_WARNING, ".".join((*path, key)))
 
 
@@ -208,66 +276,134 @@ def _should_descend(value: object, current: object) -> bool:
     )
 
 
-def _maybe_inject_variable_name(
-    target: DotMapDict[Any], key: str, value: object
-) -> object:
-    if not isinstance(value, dict):
-        return value
-    value_type = getattr(target, "_value_type", None)
-    if value_type is Variable and "name" not in value:
-        return {**value, "name": key}
-    return value
+@functools.cache
+def _toml_names(cfg_dir: Path) -> tuple[str, ...]:
+    """Return the sorted TOML file names in ``cfg_dir``, scanning it once per process.
+
+    Only used for the package-embedded directory, whose files are fixed by the
+    installed distribution.
+    """
+    return tuple(_scan_toml_names(cfg_dir))
+
+
+@functools.cache
+def _snapshot_inputs(cfg_dir: Path) -> tuple[Path, ...]:
+    """Return the files the config snapshot is built from, listed once per process.
+
+    These are the TOML files in ``cfg_dir`` and the model modules; their stats
+    key the snapshot.
+    """
+    tomls = tuple(cfg_dir / name for name in _toml_names(cfg_dir))
+    return tomls + tuple(sorted(Path(__file__).parent.glob("*.py")))
+
+
+def _scan_toml_names(cfg_dir: Path) -> list[str]:
+    """Return the sorted names of the TOML files directly in ``cfg_dir``."""
+    with os.scandir(cfg_dir) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".toml") and entry.is_file()
+        )
+
+
+def _iter_toml_paths(cfg_dir: Path, prefix: str) -> list[Path]:
+    """Return TOML paths in ``cfg_dir`` starting with ``prefix``, shortest name first."""
+    names = [name for name in _toml_names(cfg_dir) if name.startswith(prefix)]
+    return [cfg_dir / name for name in sorted(names, key=len)]
 
 
 def _iter_variable_paths(cfg_dir: Path) -> list[Path]:
     """Return variable TOML paths excluding derived label entries, sorted by shortest length first."""
-    return sorted(
-        [
-            path
-            for path in cfg_dir.glob("variables*.toml")
-            if path.name != "variables_derived_label.toml"
-        ],
-        key=lambda x: len(str(x)),
-    )
+    return [
+        path
+        for path in _iter_toml_paths(cfg_dir, "variables")
+        if path.name != "variables_derived_label.toml"
+    ]
+
 
+def _load_variables(
+    cfg_dir: Path, tomls: Mapping[Path, dict[str, object]]
+) -> VariablesFile:
+    """Load and merge variables, generating derived label entries.
 
-def _load_variables(cfg_dir: Path) -> VariablesFile:
-    """Load and merge variables, generating derived label entries."""
-    merged_variables: DotMapDict[Variable] = DotMapDict(value_type=Variable)
-    variables_sort_unit_list: list[str] | None = None
-    derived_file: VariablesFile | None = None
+    ``tomls`` holds the parsed contents of the variable TOML files by path.
+    The files are merged as raw tables and validated in a single call.
+    """
+    merged_raw: dict[str, object] = {}
+    variables_sort_unit: object = None
+    derived_names: frozenset[str] = frozenset()
 
     for path in _iter_variable_paths(cfg_dir):
-        var_toml = _load_toml(path)
-        var_file: VariablesFile = VariablesFile.model_validate(var_toml)
+        var_toml = tomls[path]
+        entries = _with_variable_names(
+            cast(dict[str, object], var_toml.get("variables", {}))
+        )
+        # Replaced entries are never merged, but must still be valid
+        replaced = {key: merged_raw[key] for key in entries.keys() & merged_raw}
+        _load_entries(Variable, replaced)
+        merged_raw.update(entries)
         if path.name == "variables_derived.toml":
-            derived_file = var_file
-        for key, variable in var_file.variables.items():
-            merged_variables[key] = variable
-        if getattr(var_file, "variables_sort_unit", None) is not None:
-            variables_sort_unit_list = var_file.variables_sort_unit
-
-    variables_file = VariablesFile(
-        variables=merged_variables,
-        variables_sort_unit=variables_sort_unit_list,
+            derived_names = frozenset(entries)
+        if var_toml.get("variables_sort_unit") is not None:
+            variables_sort_unit = var_toml["variables_sort_unit"]
+
+    variables_sort_unit = _type_adapter(list[str] | None).validate_python(
+        variables_sort_unit
     )
-    if derived_file is not None:
-        label_variables = _expand_derived_label_variables(derived_file)
-        for key, variable in label_variables.items():
-            if key not in variables_file.variables:
-                variables_file.variables[key] = variable
-    return _expand_codelist_extras(variables_file)
-
-
-def _load_datasets(cfg_dir: Path) -> DatasetsFile:
-    """Load and merge dataset TOML files."""
-    merged_datasets: DotMapDict[Dataset] = DotMapDict(value_type=Dataset)
-    for path in sorted(cfg_dir.glob("datasets*.toml"), key=lambda x: len(str(x))):
-        datatoml = _load_toml(path)
+    variables = DotMapDict(_load_entries(Variable, merged_raw), value_type=Variable)
+    _expand_variables(variables, derived_names)
+    return VariablesFile.model_construct(
+        variables_sort_unit=variables_sort_unit, variables=variables
+    )
+
+
+def _with_variable_names(entries: dict[str, object]) -> dict[str, object]:
+    """Set each table's key as its ``name`` in place and return ``entries``.
+
+    The tables come from a fresh parse, so they can be updated directly. The
+    few distinct values of the ``_INTERNED_FIELDS`` are interned on the way,
+    so the variables share one string each, also in the pickled snapshot.
+    """
+    for key, definition in entries.items():
+        if isinstance(definition, dict):
+            definition["name"] = key
+            for field in _INTERNED_FIELDS:
+                value = definition.get(field)
+                if type(value) is str:
+                    definition[field] = sys.intern(value)
+    return entries
+
+
+def _load_entries(
+    model: type[_ModelT], entries: Mapping[str, object]
+) -> dict[str, _ModelT]:
+    """Build a ``model`` instance per entry, validating all entries in one call."""
+    validated: dict[str, _ModelT] = _type_adapter(
+        dict[str, model]  # type: ignore[valid-type]
+    ).validate_python(entries)
+    return validated
+
+
+@functools.cache
+def _type_adapter(annotation: Any) -> TypeAdapter[Any]:
+    """Return a ``TypeAdapter`` for ``annotation``, building its validator once."""
+    return TypeAdapter(annotation)
+
+
+def _load_datasets(
+    cfg_dir: Path, tomls: Mapping[Path, dict[str, object]]
+) -> DatasetsFile:
+    """Load and merge dataset TOML files.
+
+    ``tomls`` holds the parsed contents of the dataset TOML files by path.
+    """
+    merged_datasets: dict[str, Dataset] = {}
+    for path in _iter_toml_paths(cfg_dir, "datasets"):
+        datatoml = tomls[path]
         if path.name == "datasets.toml":
-            data_file: DatasetsFile = DatasetsFile.model_validate(datatoml)
-            for key, dataset in data_file.datasets.items():
-                merged_datasets[key] = dataset
+            entries = cast(dict[str, object], datatoml["datasets"])
+            merged_datasets.update(_load_entries(Dataset, entries))
             continue
 
         override_file: DatasetsOverrideFile = DatasetsOverrideFile.model_validate(
@@ -279,7 +415,10 @@ def _load_datasets(cfg_dir: Path) -> DatasetsFile:
                 _merge_mapping(merged_datasets[key], override_data, path=(key,))
                 continue
             merged_datasets[key] = Dataset.model_validate(override_data)
-    return DatasetsFile(datasets=merged_datasets)
+    # The entries are validated above, so the wrapper skips validation
+    return DatasetsFile.model_construct(
+        datasets=DotMapDict(merged_datasets, value_type=Dataset)
+    )
 
 
 def load_pydantic_settings() -> NudbConfig:
@@ -292,24 +431,63 @@ def load_pydantic_settings() -> NudbConfig:
     codelist augmentations as the Dynaconf-based loader, and returns a unified
     ``NudbConfig`` object mirroring the Dynaconf structure.
 
+    The assembled config is pickled and reused by later calls, and through
+    the user's cache directory by later processes, until a TOML file, a model
+    module or a version changes. Each call returns an independent copy. Set
+    ``NUDB_CONFIG_CACHE=0`` to turn off the on-disk snapshot.
+
     Returns:
         NudbConfig: Aggregated configuration ready for downstream use.
     """
-    base = Path(str(impres.files("nudb_config")))
-    cfg_dir = base / "config_tomls"
-
-    # Read individual toml files
-    settings_toml = _load_toml(cfg_dir / "settings.toml")
-    settings_file = SettingsFile.model_validate(settings_toml)
-    paths_toml = _load_toml(cfg_dir / "paths.toml")
-    paths_file = PathsFile.model_validate(paths_toml)
-    options_toml = _load_toml(cfg_dir / "options.toml")
-    options_file = OptionsFile.model_validate(options_toml)
-    constants_toml = _load_toml(cfg_dir / "constants.toml")
-    constants_file = ConstantsFile.model_validate(constants_toml)
-
-    variables_file = _load_variables(cfg_dir)
-    dataset_file = _load_datasets(cfg_dir)
+    cfg_dir = _package_toml_dir()
+    key = cache.snapshot_key(_snapshot_inputs(cfg_dir))
+    cached = cache.read_snapshot(key)
+    if isinstance(cached, NudbConfig):
+        return cached
+    settings = _build_pydantic_settings(cfg_dir)
+    cache.write_snapshot(key, settings)
+    return settings
+
+
+@functools.cache
+def _package_toml_dir() -> Path:
+    """Return the ``config_tomls`` directory shipped inside the package.
+
+    Regular installs expose the package as a ``Path`` already, so it is used
+    as is. Other resource readers are converted, since the loader needs file
+    stats for its caches.
+    """
+    resources = impres.files("nudb_config").joinpath("config_tomls")
+    if isinstance(resources, Path):
+        return resources
+    return Path(str(resources))
+
+
+def _build_pydantic_settings(cfg_dir: Path) -> NudbConfig:
+    """Assemble ``NudbConfig`` from the TOML files in ``cfg_dir``."""
+    settings_path = cfg_dir / "settings.toml"
+    paths_path = cfg_dir / "paths.toml"
+    options_path = cfg_dir / "options.toml"
+    constants_path = cfg_dir / "constants.toml"
+    tomls = _load_tomls(
+        [
+            settings_path,
+            paths_path,
+            options_path,
+            constants_path,
+            *_iter_variable_paths(cfg_dir),
+            *_iter_toml_paths(cfg_dir, "datasets"),
+        ]
+    )
+
+    # Build individual toml files
+    settings_file = SettingsFile.model_validate(tomls[settings_path])
+    paths_file = PathsFile.model_validate(tomls[paths_path])
+    options_file = OptionsFile.model_validate(tomls[options_path])
+    constants_file = ConstantsFile.model_validate(tomls[constants_path])
+
+    variables_file = _load_variables(cfg_dir, tomls)
+    dataset_file = _load_datasets(cfg_dir, tomls)
 
     return NudbConfig(
         dapla_team=settings_file.dapla_team,
@@ -323,50 +501,41 @@ def load_pydantic_settings() -> NudbConfig:
     )
 
 
-def _expand_derived_label_variables(
-    variables_file: VariablesFile,
-) -> DotMapDict[Variable]:
-    """Create label variables for derived entries with klass codelists.
-
-    Mirrors the contents of the old ``variables_derived_label.toml`` by generating
-    ``{name}_label`` variables for derived entries whose ``klass_codelist`` is
-    a positive integer.
-    """
-    label_variables: DotMapDict[Variable] = DotMapDict(value_type=Variable)
-    for name, variable in variables_file.variables.items():
-        klass_codelist = getattr(variable, "klass_codelist", None)
-        if not isinstance(klass_codelist, int) or klass_codelist <= 0:
-            continue
-        label_name = f"{name}_label"
-        label_variables[label_name] = Variable(
-            name=label_name,
-            unit=variable.unit,
-            dtype="STRING",
-            derived_from=[name],
-        )
-    return label_variables
-
+def _expand_variables(
+    variables: DotMapDict[Variable], derived_names: Collection[str]
+) -> None:
+    """Add codelist extras and derived label variables in a single pass.
 
-def _expand_codelist_extras(variables_file: VariablesFile) -> VariablesFile:
-    """Expands codelists from KLASS that we have no direct control over, but 360 has their own values for...
+    Expands codelists from KLASS that we have no direct control over, but 360
+    has their own values for. Also mirrors the contents of the old
+    ``variables_derived_label.toml`` by generating ``{name}_label`` variables
+    for derived entries whose ``klass_codelist`` is a positive integer.
 
     Args:
-        variables_file: The VariablesFile object to expand on.
-
-    Returns:
-        VariablesFile: The modified variablesfile part after adding the codelist_extras field.
+        variables: The merged variables, updated in place.
+        derived_names: Names of the variables from ``variables_derived.toml``.
     """
-    for _name, var in variables_file.variables.items():
-        if var.klass_codelist == 91:
-            var.codelist_extras = {
-                "151": "DDR / Øst-Tyskland",
-                "135": "SSSR / Sovjetunionen",
-                "125": "Jugoslavia (til 2004) / Serbia og Montenegro (fra og med 2004)",
-                "142": "Tsjekkoslovakia",
-            }
-        if var.klass_codelist == 131:
-            var.codelist_extras = {
-                "2599": "Utland",
-                "2111": "Longyearbyen arealplanområde",
-            }
-    return variables_file
+    labels: dict[str, Variable] = {}
+    for name, var in variables.items():
+        klass_codelist = var.klass_codelist
+        if klass_codelist is None:
+            continue
+        extras = _CODELIST_EXTRAS.get(klass_codelist)
+        if extras is not None:
+            # Copy, so merging into one variable's extras leaves the others alone.
+            # The value is internal and well-formed, so skip Pydantic's __setattr__
+            object.__setattr__(var, "codelist_extras", dict(extras))
+            var.__pydantic_fields_set__.add("codelist_extras")
+        if (
+            name in derived_names
+            and isinstance(klass_codelist, int)
+            and klass_codelist > 0
+        ):
+            label_name = f"{name}_label"
+            # Built from already validated variables, so validation can be skipped
+            labels[label_name] = Variable.model_construct(
+                name=label_name, unit=var.unit, dtype="STRING", derived_from=[name]
+            )
+    for label_name, label in labels.items():
+        if label_name not in variables:
+            variables[label_name] = label
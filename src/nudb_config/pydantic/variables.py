@@ -68,27 +68,24 @@ class Variable(DotMapBaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @model_validator(mode="after")
-    def _require_outdated_comment_when_utdatert(self) -> Variable:
-        """Ensure ``outdated_comment`` is set when ``unit`` is ``utdatert``.
+    def _check_variable_rules(self) -> Variable:
+        """Check the rules that span several fields, in one validator.
 
-        Treats ``None``, empty, and whitespace-only strings as invalid.
+        ``outdated_comment`` must be set when ``unit`` is ``utdatert``, treating
+        ``None``, empty, and whitespace-only strings as invalid.
+        ``klass_codelist`` must be 0 or above when it is filled.
         """
         if self.unit == "utdatert":
-            if self.outdated_comment is None or not str(self.outdated_comment).strip():
+            outdated_comment = self.outdated_comment
+            if not outdated_comment or not outdated_comment.strip():
                 raise ValueError(
                     'outdated_comment is required when unit="utdatert" and cannot be blank'
                 )
-        return self
-
-    @model_validator(mode="after")
-    def _require_klass_codelist_to_be_positive_int(self) -> Variable:
-        if (
-            self.klass_codelist is not None
-        ):  # Wont raise error if it is the default None
-            if not isinstance(self.klass_codelist, int) or self.klass_codelist < 0:
-                raise ValueError(
-                    "If klass_codelist is filled, it must be an int of 0 or above. 0 means the variable is never supposed to have a codelist, variant or similar in klass."
-                )
+        # Wont raise error if it is the default None; the field is already an int
+        if self.klass_codelist is not None and self.klass_codelist < 0:
+            raise ValueError(
+                "If klass_codelist is filled, it must be an int of 0 or above. 0 means the variable is never supposed to have a codelist, variant or similar in klass."
+            )
         return self
 
 
@@ -109,15 +106,13 @@ class VariablesFile(DotMapBaseModel):
         """Ensure each Variable inherits its key as the ``name`` attribute."""
         variables = data.get("variables")
         if isinstance(variables, dict):
+            # Copy the tables rather than writing into the caller's input
             enriched: dict[str, Any] = {}
             for name, definition in variables.items():
                 if isinstance(definition, Variable):
                     definition.name = name
-                    enriched[name] = definition
-                    continue
-                if isinstance(definition, dict):
-                    enriched[name] = {**definition, "name": name}
-                    continue
+                elif isinstance(definition, dict):
+                    definition = {**definition, "name": name}
                 enriched[name] = definition
-            data["variables"] = enriched
+            data = {**data, "variables": enriched}
         return data
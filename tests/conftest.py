@@ -0,0 +1,37 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from nudb_config.pydantic import cache
+
+_saved_cache_env: str | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Test modules import nudb_config.settings at collection time, before any
+    # fixture runs, so keep that first load away from the on-disk snapshot
+    global _saved_cache_env
+    _saved_cache_env = os.environ.get(cache.CACHE_ENV_VAR)
+    os.environ[cache.CACHE_ENV_VAR] = "0"
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if _saved_cache_env is None:
+        os.environ.pop(cache.CACHE_ENV_VAR, None)
+    else:
+        os.environ[cache.CACHE_ENV_VAR] = _saved_cache_env
+
+
+@pytest.fixture(autouse=True)
+def _isolated_settings_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    # Keep snapshots out of the developer's real cache directory, and make sure
+    # no test is served a snapshot written by an earlier one
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv(cache.CACHE_ENV_VAR, raising=False)
+    cache.clear_memory()
+    yield
+    cache.clear_memory()
@@ -19,3 +19,9 @@ def test_fetch_variable_different() -> None:
 def test_iteration() -> None:
     for elem in settings.variables:
         assert elem
+
+
+def test_mapping_views_expose_live_field_values() -> None:
+    var = settings.variables["fnr"]
+    assert list(var.keys())[:3] == ["name", "unit", "dtype"]
+    assert dict(settings.items())["options"] is settings.options
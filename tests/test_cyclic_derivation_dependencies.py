@@ -1,56 +1,43 @@
+from collections.abc import Mapping
+from collections.abc import Sequence
+
 from nudb_config import settings
 
 
 class CyclicGraphError(Exception): ...
 
 
-def variable_is_cyclic_depth_first_search(
-    variable: str,
-    derived_graph: dict[str, list[str]],
-    visited: set[str] | None = None,
-    fail_on_cyclic: bool = False,
-) -> bool:
-    visited = visited or set()
-
-    if variable in visited:
-        if fail_on_cyclic:
-            raise CyclicGraphError(
-                f"There are cyclic 'derived_from' dependencies, '{variable}' depends on itself!"
-            )
-        return True
-
-    elif variable not in derived_graph.keys():
-        return False
-
-    derived_from: list[str] = derived_graph[variable]
-    visited_next: set[str] = visited | {variable}
-
-    for variable_next in derived_from:
-        from_is_cyclic = variable_is_cyclic_depth_first_search(
-            variable=variable_next,
-            derived_graph=derived_graph,
-            visited=visited_next,
-            fail_on_cyclic=fail_on_cyclic,
-        )
-
-        if from_is_cyclic:
-            return True
-
-    return False
+_UNVISITED, _IN_PROGRESS, _DONE = 0, 1, 2
 
 
 def is_cyclic_depth_first_search(
-    derived_graph: dict[str, list[str]], fail_on_cyclic: bool = False
+    derived_graph: Mapping[str, Sequence[str]], fail_on_cyclic: bool = False
 ) -> bool:
-    for variable in derived_graph.keys():
-        is_cyclic = variable_is_cyclic_depth_first_search(
-            variable=variable,
-            derived_graph=derived_graph,
-            fail_on_cyclic=fail_on_cyclic,
-        )
-
-        if is_cyclic:
-            return True
+    # Three-colour DFS: a variable met again while still in progress closes a
+    # cycle, and finished variables are never walked twice
+    state: dict[str, int] = {}
+    for root in derived_graph:
+        if state.get(root, _UNVISITED) != _UNVISITED:
+            continue
+        state[root] = _IN_PROGRESS
+        stack = [(root, iter(derived_graph[root]))]
+        while stack:
+            variable, derived_from = stack[-1]
+            variable_next = next(derived_from, None)
+            if variable_next is None:
+                state[variable] = _DONE
+                stack.pop()
+                continue
+            next_state = state.get(variable_next, _UNVISITED)
+            if next_state == _IN_PROGRESS:
+                if fail_on_cyclic:
+                    raise CyclicGraphError(
+                        f"There are cyclic 'derived_from' dependencies, '{variable_next}' depends on itself!"
+                    )
+                return True
+            if next_state == _UNVISITED and variable_next in derived_graph:
+                state[variable_next] = _IN_PROGRESS
+                stack.append((variable_next, iter(derived_graph[variable_next])))
 
     return False
 
@@ -66,6 +53,10 @@ def test_cyclic_graph() -> None:
     assert is_cyclic_depth_first_search(cyclic_graph)
 
 
+def test_self_referencing_graph() -> None:
+    assert is_cyclic_depth_first_search({"a": ["a"]})
+
+
 def test_non_cyclic_graph() -> None:
     non_cyclic_graph: dict[str, list[str]] = {
         "a": ["b"],
@@ -79,6 +70,8 @@ def test_non_cyclic_graph() -> None:
 
 def test_cyclic_derived_from() -> None:
     variables = settings.variables
-    derived_graph = {k: v.derived_from for k, v in variables.items() if v.derived_from}
+    derived_graph = {
+        k: tuple(v.derived_from) for k, v in variables.items() if v.derived_from
+    }
 
     assert not is_cyclic_depth_first_search(derived_graph, fail_on_cyclic=True)
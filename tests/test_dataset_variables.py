@@ -1,3 +1,5 @@
+from collections import Counter
+
 from nudb_config import settings
 
 
@@ -5,13 +7,11 @@ def test_dataset_variables_are_unique() -> None:
     duplicate_variables: list[tuple[str, str]] = []
 
     for dataset_name, dataset in settings.datasets.items():
-        variables = getattr(dataset, "variables", None) or []
-        seen: set[str] = set()
-        for variable in variables:
-            if variable in seen:
-                duplicate_variables.append((dataset_name, variable))
-            else:
-                seen.add(variable)
+        variables = dataset.variables or ()
+        if len(variables) == len(set(variables)):
+            continue
+        for variable, count in Counter(variables).items():
+            duplicate_variables.extend([(dataset_name, variable)] * (count - 1))
 
     assert not duplicate_variables, (
         "Duplicate entries found in settings.datasets.-dataset names-.variables. Each variable name must be unique "
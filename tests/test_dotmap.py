@@ -1,6 +1,12 @@
+from enum import StrEnum
+
 import pytest
+from pydantic import BaseModel
 
 from nudb_config.pydantic.dotmap import DotMap
+from nudb_config.pydantic.dotmap import DotMapDict
+from nudb_config.pydantic.dotmap import DotMapMixin
+from nudb_config.pydantic.variables import Variable
 
 
 def test_dotmap_get_basic() -> None:
@@ -23,3 +29,82 @@ def test_dotmap_get_basic() -> None:
     # Should raise an error if the element is not there
     with pytest.raises(KeyError):
         dm["c"]
+
+
+def test_dotmapdict_integer_index() -> None:
+    dm: DotMapDict[int] = DotMapDict({"a": 1, "b": 2})
+
+    assert dm[0] == 1
+    assert dm[-1] == 2
+    with pytest.raises(IndexError):
+        dm[2]
+
+    dm[-1] = 3
+    assert dm.b == 3
+
+
+def test_dotmap_wrapper_has_no_instance_dict() -> None:
+    dm = DotMap({"a": 1})
+    assert not hasattr(dm, "__dict__")
+
+    dm["b"] = 2
+    assert dm.b == 2
+
+
+def test_model_field_names_cached_for_contains() -> None:
+    assert Variable._field_names == frozenset(Variable.model_fields)
+
+    var = Variable(name="x", unit="stk", dtype="STRING")
+    assert "unit" in var
+    assert "not_a_field" not in var
+    assert 1 not in var
+
+
+def test_mixin_first_pydantic_model_reads_fields() -> None:
+    class Model(DotMapMixin, BaseModel):
+        a: int
+
+    model = Model(a=1)
+    assert Model._is_pydantic
+    assert model["a"] == 1
+    assert model.get("a") == 1
+    assert list(model.keys()) == ["a"]
+
+
+def test_dotmapdict_schema_for_model_union_is_not_shared() -> None:
+    class Inner(BaseModel):
+        x: int = 0
+
+    class First(BaseModel):
+        inner: Inner
+        mapping: DotMapDict[Inner | None]
+
+    class Second(BaseModel):
+        mapping: DotMapDict[Inner | None]
+
+    second = Second.model_validate({"mapping": {"a": {"x": 1}}})
+    assert second.mapping.a == Inner(x=1)
+
+
+def test_str_subclass_keys_are_accepted() -> None:
+    class Key(StrEnum):
+        a = "a"
+        unit = "unit"
+
+    dm: DotMapDict[int] = DotMapDict({"a": 1})
+    assert dm[Key.a] == 1
+
+    dm[Key.a] = 2
+    assert dm.a == 2
+
+    var = Variable(name="x", unit="stk", dtype="STRING")
+    assert var[Key.unit] == "stk"
+
+
+def test_dotmapdict_keeps_keys_that_cannot_be_interned() -> None:
+    class Key(StrEnum):
+        a = "a"
+
+    assert DotMapDict({Key.a: 1}).a == 1
+    int_keyed: DotMapDict[str] = DotMapDict({1: "x"})  # type: ignore[dict-item]
+    assert int_keyed[0] == "x"
@@ -1,6 +1,10 @@
 import importlib
+import os
+import subprocess
+import sys
 import warnings
 from importlib import metadata
+from pathlib import Path
 from unittest.mock import patch
 
 import nudb_config
@@ -39,3 +43,39 @@ def test_missing_version_warns_and_defaults() -> None:
         isinstance(warning.message, nudb_config.MissingVersionWarning)
         for warning in caught
     )
+
+
+def _run_isolated(code: str) -> list[str]:
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    # The subprocess must neither read nor write the on-disk settings snapshot
+    env = {**os.environ, "PYTHONPATH": src, "NUDB_CONFIG_CACHE": "0"}
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+def test_import_does_not_load_settings() -> None:
+    code = (
+        "import sys, nudb_config; "
+        "print('nudb_config.config' in sys.modules); "
+        "nudb_config.settings; "
+        "print('nudb_config.config' in sys.modules)"
+    )
+
+    assert _run_isolated(code) == ["False", "True"]
+
+
+def test_pydantic_subpackage_imports_pydantic_lazily() -> None:
+    code = (
+        "import sys, nudb_config.pydantic as p; "
+        "print('pydantic' in sys.modules); "
+        "p.load_pydantic_settings; "
+        "print('pydantic' in sys.modules)"
+    )
+
+    assert _run_isolated(code) == ["False", "True"]
@@ -1,9 +1,11 @@
 from collections.abc import Iterator
+from pathlib import Path
 
 import pytest
 
 from nudb_config import config as config_module
 from nudb_config.pydantic.load import NudbConfig
+from nudb_config.pydantic.load import _load_toml
 from nudb_config.pydantic.load import load_pydantic_settings
 
 
@@ -52,3 +54,15 @@ def test_content_settings_after_merge_from_tomls(
 
     # check if removal worked
     assert "snr_mrk" not in combo_settings.variables
+
+
+def test_load_toml_returns_fresh_copies_and_sees_edits(tmp_path: Path) -> None:
+    path = tmp_path / "settings.toml"
+    path.write_text('short_name = "a"\n')
+
+    first = _load_toml(path)
+    first["short_name"] = "changed"
+    assert _load_toml(path) == {"short_name": "a"}
+
+    path.write_text('short_name = "bb"\n')
+    assert _load_toml(path) == {"short_name": "bb"}
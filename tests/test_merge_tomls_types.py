@@ -6,7 +6,7 @@ from nudb_config import config as config_module
 from nudb_config.pydantic.datasets import Dataset
 from nudb_config.pydantic.dotmap import DotMapDict
 from nudb_config.pydantic.load import NudbConfig
-from nudb_config.pydantic.load import _merge_dotmap_model
+from nudb_config.pydantic.load import _merge_mapping
 from nudb_config.pydantic.load import load_pydantic_settings
 from nudb_config.pydantic.options import Options
 from nudb_config.pydantic.paths import PathEntry
@@ -50,15 +50,15 @@ def test_merge_tomls_preserves_types(isolated_settings: NudbConfig) -> None:
 
 def test_merge_dotmap_model_ignores_unknown_fields() -> None:
     options = Options()
-    _merge_dotmap_model(options, {"extra_key": "value"}, path=())
+    _merge_mapping(options, {"extra_key": "value"}, path=())
     assert not hasattr(options, "extra_key")
 
 
 def test_merge_dotmap_model_none_sentinel_respects_optional() -> None:
     options = Options()
-    _merge_dotmap_model(options, {"warn_unsafe_derive": "None"}, path=())
+    _merge_mapping(options, {"warn_unsafe_derive": "None"}, path=())
     assert options.warn_unsafe_derive is True
 
     path_entry = PathEntry(katalog="/tmp", shared_utdanning_internal="/tmp")
-    _merge_dotmap_model(path_entry, {"katalog": "None"}, path=())
+    _merge_mapping(path_entry, {"katalog": "None"}, path=())
     assert path_entry.katalog is None
@@ -11,19 +11,23 @@ import pytest
 _DOTMAP_PATH = (
     Path(__file__).parents[1] / "src" / "nudb_config" / "pydantic" / "dotmap.py"
 )
-_spec = importlib.util.spec_from_file_location("_dotmap_module", _DOTMAP_PATH)
-assert _spec is not None and _spec.loader is not None
-_module = importlib.util.module_from_spec(_spec)
-sys.modules["_dotmap_module"] = _module
-_spec.loader.exec_module(_module)
-# Tell mypy that the dynamically imported attribute is a class (type)
+# Reuse the module if this file is imported again, e.g. by another worker
+_module = sys.modules.get("_dotmap_module")
+if _module is None:
+    _spec = importlib.util.spec_from_file_location("_dotmap_module", _DOTMAP_PATH)
+    assert _spec is not None and _spec.loader is not None
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules["_dotmap_module"] = _module
+    _spec.loader.exec_module(_module)
+# Tell mypy that the dynamically imported attributes are classes (types)
 DotMap = cast(type, _module.DotMap)
+DotMapMixin = cast(type, _module.DotMapMixin)
 
 
 def test_missing_attr_on_pydantic_model_triggers_dotmap_getattr() -> None:
-    # Simulate a Pydantic-like base: DotMap detects Pydantic at runtime and
-    # defers to super().__init__. When pydantic isn't installed, it treats
-    # "object" as the base, so any subclass will follow the Pydantic path.
+    # Simulate a Pydantic-like base: DotMapMixin leaves initialization to the
+    # base class, and its __getattr__ only runs for attributes that normal
+    # lookup did not find.
     class DummyBase:
         def __init__(self, *args: object, **kwargs: object) -> None:
             # Accept arbitrary init to mimic BaseModel behavior for this test.
@@ -37,11 +41,19 @@ def test_missing_attr_on_pydantic_model_triggers_dotmap_getattr() -> None:
     else:
         # Create the class dynamically to avoid mypy complaining about using a
         # dynamically imported base in a class definition.
-        Model = type("Model", (DotMap, DummyBase), {})
+        Model = type("Model", (DotMapMixin, DummyBase), {})
 
     m = Model(x=1)
 
-    # Access a missing attribute; DotMap.__getattr__ should run and, since
-    # no internal mapping exists on a BaseModel mixin, raise AttributeError.
+    # Access a missing attribute; DotMapMixin.__getattr__ should run and
+    # raise AttributeError, since the mixin keeps no data of its own.
     with pytest.raises(AttributeError):
         _ = m.missing_attribute  # type: ignore[attr-defined]
+
+
+def test_dotmap_cannot_be_mixed_into_pydantic_model() -> None:
+    # DotMap is a dict subclass now, so models must use DotMapMixin instead
+    from pydantic import BaseModel
+
+    with pytest.raises(TypeError, match="instance lay-out conflict"):
+        type("Model", (DotMap, BaseModel), {})
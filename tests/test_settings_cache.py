@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from nudb_config.pydantic import cache
+from nudb_config.pydantic.load import load_pydantic_settings
+
+
+@pytest.fixture
+def cache_home(tmp_path: Path) -> Path:
+    # tests/conftest.py already points XDG_CACHE_HOME here and clears memory
+    return tmp_path / "cache"
+
+
+def test_snapshot_is_written_and_reused(cache_home: Path) -> None:
+    first = load_pydantic_settings()
+    assert cache.cache_path().is_relative_to(cache_home)
+    assert cache.cache_path().exists()
+
+    second = load_pydantic_settings()
+    assert second is not first
+    assert repr(second) == repr(first)
+    assert second.variables.fnr.name == "fnr"
+
+
+def test_installs_use_separate_snapshot_files(tmp_path: Path) -> None:
+    first = cache._file_name(tmp_path / "venv-a" / "nudb_config")
+    second = cache._file_name(tmp_path / "venv-b" / "nudb_config")
+    assert first != second
+    assert cache.cache_path().name == cache._file_name(cache._PACKAGE_DIR)
+
+
+def test_snapshot_with_other_key_is_ignored(cache_home: Path) -> None:
+    load_pydantic_settings()
+    assert cache.read_snapshot(("stale",)) is None
+
+
+def test_snapshot_can_be_disabled(
+    cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(cache.CACHE_ENV_VAR, "0")
+    load_pydantic_settings()
+    assert not cache.cache_path().exists()
+
+
+def test_loads_in_one_process_return_independent_copies(
+    cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(cache.CACHE_ENV_VAR, "0")
+    first = load_pydantic_settings()
+    first.variables.fnr.unit = "changed"
+
+    second = load_pydantic_settings()
+    assert second.variables.fnr.unit != "changed"
+    assert not cache.cache_path().exists()
@@ -2,16 +2,15 @@ from nudb_config import settings
 
 
 def test_all_dataset_variables_are_defined() -> None:
-    defined_variables = set(settings.variables.keys())
-    referenced_variables = {
-        variable
-        for dataset in settings.datasets.values()
-        for variable in getattr(dataset, "variables", []) or []
-        if dataset.team
-        == "utd-nudb"  # We are not taking responsibility for definition of variables in external datasets
-    }
-
-    missing_definitions = referenced_variables - defined_variables
+    defined_variables = settings.variables.keys()
+    missing_definitions: set[str] = set()
+    for dataset in settings.datasets.values():
+        # We are not taking responsibility for definition of variables in external datasets
+        if dataset.team != "utd-nudb":
+            continue
+        for variable in dataset.variables or ():
+            if variable not in defined_variables:
+                missing_definitions.add(variable)
 
     assert not missing_definitions, (
         "Variables referenced in settings.datasets.-dataset names-.variables that are missing definitions in "
@@ -23,13 +22,12 @@ def test_derived_join_keys_are_in_derived_from() -> None:
     missing_join_keys = []
 
     for variable in settings.variables.values():
-        join_keys = getattr(variable, "derived_join_keys", None)
+        join_keys = variable.derived_join_keys
         if not join_keys:
             continue
-        derived_from = set(getattr(variable, "derived_from", []) or [])
-        missing = [key for key in join_keys if key not in derived_from]
+        missing = set(join_keys).difference(variable.derived_from or ())
         if missing:
-            missing_join_keys.append((variable.name, missing))
+            missing_join_keys.append((variable.name, sorted(missing)))
 
     assert not missing_join_keys, (
         "Derived join keys referenced in settings.variables.-variable names-.derived_join_keys that are missing from "
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 import pytest
 
 from nudb_config import settings
@@ -6,11 +8,11 @@ from nudb_config import settings
 def test_variables_sort_unit() -> None:
     variables_sort_unit = settings.variables_sort_unit
     assert variables_sort_unit
-    assert all([isinstance(x, str) for x in variables_sort_unit])
+    assert all(isinstance(x, str) for x in variables_sort_unit)
 
 
 def test_variables_name_field() -> None:
-    assert all([isinstance(x.name, str) and len(x.name) for x in settings.variables])
+    assert all(isinstance(x.name, str) and x.name for x in settings.variables)
 
 
 def test_inserting_non_existant_field_raises() -> None:
@@ -23,14 +25,16 @@ def test_nus_label_klass_variable_dynamic_created() -> None:
 
 
 def test_renamed_from_entries_are_unique_across_variables() -> None:
-    renamed_index: dict[str, str] = {}
-    duplicates: list[str] = []
-
+    renamed_to: defaultdict[str, list[str]] = defaultdict(list)
     for var_name, variable in settings.variables.items():
-        for old_name in variable.renamed_from or []:
-            first_seen = renamed_index.setdefault(old_name, var_name)
-            if first_seen != var_name:
-                duplicates.append(f"{old_name} -> {first_seen}, {var_name}")
+        for old_name in variable.renamed_from or ():
+            renamed_to[old_name].append(var_name)
+
+    duplicates = [
+        f"{old_name} -> {', '.join(dict.fromkeys(var_names))}"
+        for old_name, var_names in renamed_to.items()
+        if len(set(var_names)) > 1
+    ]
 
     assert not duplicates, (
         "renamed_from values must be unique across variables; duplicates found: "
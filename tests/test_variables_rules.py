@@ -5,10 +5,10 @@ def test_klass_codelist_present_when_variant_metadata_present() -> None:
     offenders: list[str] = []
 
     for name, var in settings.variables.items():
-        has_correspondence = getattr(var, "klass_correspondence_to", None) is not None
-        has_variant_search = bool(getattr(var, "klass_variant_search_term", None))
+        has_correspondence = var.klass_correspondence_to is not None
+        has_variant_search = bool(var.klass_variant_search_term)
         if has_correspondence or has_variant_search:
-            if getattr(var, "klass_codelist", None) is None:
+            if var.klass_codelist is None:
                 offenders.append(name)
 
     assert offenders == [], (
@@ -21,20 +21,19 @@ def test_klass_codelist_or_variant_requires_length_list_of_ints() -> None:
     offenders: list[str] = []
 
     for name, var in settings.variables.items():
-        codelist_filled = getattr(var, "klass_codelist", None) not in (None, 0)
-        variant_filled = getattr(var, "klass_variant", None) is not None
-        if getattr(var, "dtype", "") == "BOOLEAN" or not (
-            codelist_filled or variant_filled
-        ):
+        codelist_filled = var.klass_codelist not in (None, 0)
+        variant_filled = var.klass_variant is not None
+        if var.dtype == "BOOLEAN" or not (codelist_filled or variant_filled):
             continue
 
-        length = getattr(var, "length", None)
-        if not (
-            isinstance(length, list)
-            and length
-            and all(isinstance(x, int) for x in length)
-        ):
+        length = var.length
+        if type(length) is not list or not length:
             offenders.append(name)
+            continue
+        for x in length:
+            if type(x) is not int:
+                offenders.append(name)
+                break
 
     assert offenders == [], (
         "Variables with 'klass_codelist' or 'klass_variant' must declare a non-empty "
@@ -45,7 +44,7 @@ def test_klass_codelist_or_variant_requires_length_list_of_ints() -> None:
 
 def test_derived_from_references_existing_variables() -> None:
     missing_dependencies: dict[str, list[str]] = {}
-    known_variables = set(settings.variables.keys())
+    known_variables = settings.variables.keys()
 
     for name, var in settings.variables.items():
         if not var.derived_from:
@@ -69,12 +68,12 @@ def test_variables_with_codelist_have_label_variant() -> None:
     offenders: list[str] = []
 
     for name, var in settings.variables.items():
-        klass_codelist = getattr(var, "klass_codelist", None)
+        klass_codelist = var.klass_codelist
         if not (isinstance(klass_codelist, int) and klass_codelist > 0):
             continue
 
-        dtype = str(getattr(var, "dtype", "") or "").upper()
-        outdated_comment = getattr(var, "outdated_comment", None)
+        dtype = var.dtype.upper()
+        outdated_comment = var.outdated_comment
         outdated_filled = bool(outdated_comment) and str(outdated_comment).strip() != ""
 
         # Boolean or explicitly outdated variables should not require a label variant
@@ -88,3 +87,12 @@ def test_variables_with_codelist_have_label_variant() -> None:
         "Variables with 'klass_codelist' > 0 must have a corresponding "
         f"`*_label` entry: {sorted(offenders)}"
     )
+
+
+def test_codelist_extras_are_expanded_per_variable() -> None:
+    with_extras = [
+        var for var in settings.variables.values() if var.klass_codelist == 91
+    ]
+    assert len(with_extras) > 1
+    assert all(var.codelist_extras for var in with_extras)
+    assert with_extras[0].codelist_extras is not with_extras[1].codelist_extras
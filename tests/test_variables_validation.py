@@ -4,15 +4,19 @@ import pytest
 from pydantic import ValidationError
 
 from nudb_config.pydantic.variables import Variable
+from nudb_config.pydantic.variables import VariablesFile
 
 
-def test_utdatert_with_missing_outdated_comment_raises() -> None:
-    with pytest.raises(ValidationError):
-        Variable(unit="utdatert", dtype="STRING", name="test_navn")
-
+@pytest.mark.parametrize("outdated_comment", [None, " "])
+def test_utdatert_with_missing_outdated_comment_raises(
+    outdated_comment: str | None,
+) -> None:
     with pytest.raises(ValidationError):
         Variable(
-            unit="utdatert", dtype="STRING", outdated_comment=" ", name="test_navn"
+            unit="utdatert",
+            dtype="STRING",
+            outdated_comment=outdated_comment,
+            name="test_navn",
         )
 
 
@@ -29,3 +33,13 @@ def test_utdatert_with_outdated_comment_ok() -> None:
 def test_non_utdatert_without_outdated_comment_ok() -> None:
     v = Variable(unit="na", dtype="STRING", name="test_navn")
     assert v.outdated_comment is None
+
+
+def test_variables_file_validation_leaves_input_unchanged() -> None:
+    definition = {"unit": "na", "dtype": "STRING"}
+    data = {"variables": {"test_navn": definition}}
+
+    variables_file = VariablesFile.model_validate(data)
+
+    assert variables_file.variables.test_navn.name == "test_navn"
+    assert data == {"variables": {"test_navn": {"unit": "na", "dtype": "STRING"}}}